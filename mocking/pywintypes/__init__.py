@@ -1,2 +1,5 @@
-class datetime(object):
+from datetime import datetime as _datetime
+
+
+class datetime(_datetime):
     """Windows Datetime (mocked)"""
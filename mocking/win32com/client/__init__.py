@@ -76,6 +76,8 @@ class COMObject_MSProject_Application:
         https://docs.microsoft.com/en-us/previous-versions/office/developer/office-2003/aa194664(v=office.11)
         """
 
+    ScreenUpdating: bool = True
+
     @property
     def Projects(self) -> Iterable[MSProject_Project]:
 
@@ -84,3 +86,7 @@ class COMObject_MSProject_Application:
 
 def Dispatch(application: str) -> COMObject_MSProject_Application:
     """Create a COM connection"""
+
+
+# Imported at the end as it uses the classes defined above
+from . import gencache  # noqa: E402,F401
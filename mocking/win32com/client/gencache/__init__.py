@@ -0,0 +1,5 @@
+from .. import COMObject_MSProject_Application
+
+
+def EnsureDispatch(application: str) -> COMObject_MSProject_Application:
+    """Create a COM connection with early binding"""
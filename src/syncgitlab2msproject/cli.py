@@ -7,9 +7,11 @@ import argparse
 import functools
 import logging
 import sys
+from datetime import datetime
+from gitlab import Gitlab
 from pathlib import Path
 from requests import ConnectionError
-from typing import List
+from typing import Callable, List
 
 from syncgitlab2msproject import Issue, MSProject, __version__
 
@@ -18,9 +20,11 @@ __copyright__ = "Carli Freudenberg"
 __license__ = "MIT"
 
 from syncgitlab2msproject.custom_types import WebURL
+from syncgitlab2msproject.exceptions import GraphQLQueryError
 from syncgitlab2msproject.gitlab_issues import (
     get_gitlab_class,
     get_group_issues,
+    get_group_issues_graphql,
     get_project_issues,
 )
 from syncgitlab2msproject.helper_classes import ForceFixedWork, SetTaskTypeConservative
@@ -90,6 +94,32 @@ def parse_args(args):
         action="store_true",
     )
 
+    parser.add_argument(
+        "--graphql",
+        dest="graphql",
+        help="Load the issues of a group with a single GraphQL query "
+        "instead of the REST API",
+        action="store_true",
+    )
+
+    parser.add_argument(
+        "--state",
+        dest="state",
+        help="Only load Gitlab Issues with this state. Tasks of issues that are "
+        "not loaded are left untouched",
+        default=None,
+        choices=["opened", "closed"],
+    )
+
+    parser.add_argument(
+        "--updated-after",
+        dest="updated_after",
+        help="Only load Gitlab Issues updated after this ISO date "
+        "(i.e. 2021-01-31). Tasks of issues that are not loaded are left untouched",
+        default=None,
+        type=datetime.fromisoformat,
+    )
+
     # TODO read from ENV
     parser.add_argument(
         "--gitlab-url",
@@ -110,6 +140,22 @@ def parse_args(args):
         type=str,
     )
 
+    parser.add_argument(
+        "--ca-bundle",
+        dest="ca_bundle",
+        help="CA bundle file used to verify the SSL certificate of gitlab",
+        default=None,
+        type=str,
+    )
+
+    parser.add_argument(
+        "--no-ssl-verify",
+        dest="ssl_verify",
+        help="Do not verify the SSL certificate of the gitlab instance "
+        "(verified by default)",
+        action="store_false",
+    )
+
     parser.add_argument(
         "gitlab_resource_type",
         help="Gitlab resource type to sync with",
@@ -129,7 +175,16 @@ def parse_args(args):
         type=str,
     )
 
-    return parser.parse_args(args)
+    parsed_args = parser.parse_args(args)
+    if parsed_args.graphql and parsed_args.gitlab_resource_type != "group":
+        parser.error("--graphql can only be used with the group resource type")
+    if parsed_args.graphql and (
+        parsed_args.state is not None or parsed_args.updated_after is not None
+    ):
+        parser.error("--state and --updated-after can't be used with --graphql")
+    if parsed_args.ca_bundle is not None and not parsed_args.ssl_verify:
+        parser.error("--ca-bundle can't be used with --no-ssl-verify")
+    return parsed_args
 
 
 def setup_logging(loglevel):
@@ -214,12 +269,25 @@ def main(args):
     _logger.debug("Starting loading issues")
 
     Ignore_project_id = args.ignore_project
-    gitlab = get_gitlab_class(args.gitlab_url, args.gitlab_token)
+    gitlab = get_gitlab_class(
+        args.gitlab_url,
+        args.gitlab_token,
+        ssl_verify=args.ssl_verify,
+        ca_bundle=args.ca_bundle,
+    )
 
+    get_issues_func: Callable[[Gitlab, int], List[Issue]]
     if args.gitlab_resource_type == "project":
-        get_issues_func = get_project_issues
+        get_issues_func = functools.partial(
+            get_project_issues, state=args.state, updated_after=args.updated_after
+        )
     elif args.gitlab_resource_type == "group":
-        get_issues_func = get_group_issues
+        if args.graphql:
+            get_issues_func = get_group_issues_graphql
+        else:
+            get_issues_func = functools.partial(
+                get_group_issues, state=args.state, updated_after=args.updated_after
+            )
     else:
         raise ValueError("Invalid Resource Type")
 
@@ -233,6 +301,9 @@ def main(args):
     except ConnectionError as e:
         _logger.error(f"Error contacting gitlab instance: {e}")
         exit(64)
+    except GraphQLQueryError as e:
+        _logger.error(f"Error loading the issues from gitlab: {e}")
+        exit(65)
     else:
         include_issue = functools.partial(has_not_label, label=args.ignore_label)
         with MSProject(ms_project_file.absolute()) as tasks:
@@ -10,6 +10,10 @@ class IssueReferenceDuplicated(GitlabSyncError):
     pass
 
 
+class GraphQLQueryError(GitlabSyncError):
+    """The Gitlab GraphQL API answered with errors"""
+
+
 class MSProjectSyncError(ValueError):
     pass
 
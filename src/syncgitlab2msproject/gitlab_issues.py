@@ -1,17 +1,91 @@
-import dateutil.parser
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from gitlab import Gitlab
 from gitlab.v4.objects import Project
+from itertools import islice
 from logging import getLogger
-from typing import Dict, List, Optional, Union
+from operator import itemgetter
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from urllib3.util.retry import Retry
 
 from .custom_types import GitlabIssue, GitlabUserDict
-from .exceptions import MovedIssueNotDefined
+from .exceptions import GraphQLQueryError, MovedIssueNotDefined
 from .funcions import warn_once
 
 logger = getLogger(f"{__package__}.{__name__}")
 
+# Maximum page size allowed by the Gitlab API
+PER_PAGE = 100
+# Number of pages fetched in parallel
+MAX_PAGE_WORKERS = 8
+
+# Access the full reference within the attributes of an issue
+_get_references = itemgetter("references")
+_get_full_ref = itemgetter("full")
+
+# Query all data required for the sync of all issues of a group at once
+GROUP_ISSUES_QUERY = """
+query($fullPath: ID!, $after: String) {
+  group(fullPath: $fullPath) {
+    issues(includeSubgroups: true, first: 100, after: $after) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        id
+        iid
+        projectId
+        title
+        description
+        state
+        webUrl
+        reference(full: true)
+        createdAt
+        closedAt
+        dueDate
+        movedTo {
+          id
+        }
+        timeEstimate
+        totalTimeSpent
+        taskCompletionStatus {
+          count
+          completedCount
+        }
+        assignees {
+          nodes {
+            name
+          }
+        }
+        labels {
+          nodes {
+            title
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """
+    Parse the ISO-8601 timestamps given by the Gitlab API
+
+    Gitlab marks UTC with a trailing 'Z' which ``fromisoformat`` only
+    understands starting with Python 3.11.
+    Many issues share the same dates (i.e. due dates of a milestone) and
+    datetime objects are immutable, so every distinct string is parsed once.
+    """
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 
 def get_user_identifier(user_dict: GitlabUserDict) -> str:
     """
@@ -19,7 +93,55 @@ def get_user_identifier(user_dict: GitlabUserDict) -> str:
 
     keep as separate function to allow easier changes later if required
     """
-    return str(user_dict["name"])
+    name = user_dict["name"]
+    return name if isinstance(name, str) else str(name)
+
+
+@dataclass(frozen=True)
+class IssueView:
+    """
+    Snapshot of all issue values required to sync an issue
+
+    All values are extracted once, so reading them is a plain attribute access.
+    The time estimate is not part of it, as it is only needed for tasks
+    without children.
+    """
+
+    __slots__ = (
+        "id",
+        "iid",
+        "project_id",
+        "group_id",
+        "title",
+        "due_date",
+        "time_spent_total",
+        "has_tasks",
+        "percentage_tasks_done",
+        "full_ref",
+        "web_url",
+        "labels",
+        "created_at",
+        "assignees",
+        "is_closed",
+        "closed_at",
+    )
+
+    id: int
+    iid: int
+    project_id: int
+    group_id: Optional[int]
+    title: str
+    due_date: Optional[datetime]
+    time_spent_total: Optional[float]
+    has_tasks: bool
+    percentage_tasks_done: int
+    full_ref: str
+    web_url: str
+    labels: Tuple[str, ...]
+    created_at: Optional[datetime]
+    assignees: Tuple[str, ...]
+    is_closed: bool
+    closed_at: Optional[datetime]
 
 
 class Issue:
@@ -28,10 +150,12 @@ class Issue:
     """
 
     # The issue object itself is not dynamic only the contained obj is!
+    # __dict__ is only used to store the values of the cached properties
     __slots__ = [
         "obj",
         "_moved_reference",
         "_fixed_group_id",
+        "__dict__",
     ]
 
     def __init__(self, obj: GitlabIssue, fixed_group_id: Optional[int] = None):
@@ -71,6 +195,45 @@ class Issue:
         if not isinstance(value, Issue):
             raise ValueError("Can only set an Issue object as moved reference!")
         self._moved_reference = value
+        # The percentage of a moved issue is taken from the reference
+        self.__dict__.pop("percentage_tasks_done", None)
+        self.__dict__.pop("view", None)
+
+    @cached_property
+    def view(self) -> IssueView:
+        """
+        Snapshot of the values required for syncing the issue
+
+        Evaluated on first access, so moved references have to be set before
+
+        :exceptions MovedIssueNotDefined
+        """
+        return IssueView(
+            id=self.id,
+            iid=self.iid,
+            project_id=self.project_id,
+            group_id=self.group_id,
+            title=self.title,
+            due_date=self.due_date,
+            time_spent_total=self.time_spent_total,
+            has_tasks=self.has_tasks,
+            percentage_tasks_done=self.percentage_tasks_done,
+            full_ref=self.full_ref,
+            web_url=self.web_url,
+            labels=self.labels,
+            created_at=self.created_at,
+            assignees=self.assignees,
+            is_closed=self.is_closed,
+            closed_at=self.closed_at,
+        )
+
+    @classmethod
+    def from_graphql(cls, node: Dict[str, Any]) -> "Issue":
+        """
+        Create an issue from a node returned by the Gitlab GraphQL API
+        """
+        obj = GraphQLIssue(_graphql_to_rest_attributes(node))
+        return cls(cast(GitlabIssue, obj))
 
     def __str__(self):
         return f"'{self.title}' (ID: {self.id})"
@@ -125,14 +288,19 @@ class Issue:
         return self.obj.has_tasks
 
     @property
-    def is_closed(self) -> bool:
-        return str(self.obj.state).lower().strip().startswith("closed")
+    def task_completion_status(self) -> Dict[str, int]:
+        return self.obj.task_completion_status
 
+    # Gitlab gives the state as lower case string, either 'opened' or 'closed'
     @property
-    def is_open(self):
-        return not self.is_closed
+    def is_closed(self) -> bool:
+        return self.obj.state == "closed"
 
     @property
+    def is_open(self) -> bool:
+        return self.obj.state == "opened"
+
+    @cached_property
     def percentage_tasks_done(self) -> int:
         """
         Percentage of tasks done, 0 if no tasks are defined and not closed.
@@ -146,10 +314,11 @@ class Issue:
                 assert self._moved_reference is not None
                 return self._moved_reference.percentage_tasks_done
             return 100
-        if not self.has_tasks:
-            return 0
         task = self.task_completion_status
-        return round(task["completed_count"] / task["count"] * 100)
+        if (count := task["count"]) == 0:
+            return 0
+        # Integer only rounding (half up) to avoid float conversion
+        return (task["completed_count"] * 100 + count // 2) // count
 
     @property
     def moved_to_id(self) -> Optional[int]:
@@ -163,22 +332,22 @@ class Issue:
     def description(self) -> str:
         return self.obj.description
 
-    @property
+    @cached_property
     def closed_at(self) -> Optional[datetime]:
         if (val := self.obj.closed_at) is not None:
-            return dateutil.parser.parse(val)
+            return _parse_iso(val)
         return None
 
-    @property
+    @cached_property
     def created_at(self) -> Optional[datetime]:
         if (val := self.obj.created_at) is not None:
-            return dateutil.parser.parse(val)
+            return _parse_iso(val)
         return None
 
-    @property
+    @cached_property
     def due_date(self) -> Optional[datetime]:
         if (val := self.obj.due_date) is not None:
-            return dateutil.parser.parse(val)
+            return _parse_iso(val)
         return None
 
     @property
@@ -187,27 +356,25 @@ class Issue:
             return get_user_identifier(val)
         return None
 
-    def _get_from_time_stats(self, key) -> Optional[float]:
+    @cached_property
+    def _time_stats(self) -> Dict[str, float]:
         """
         Somehow the python-gitlab API seems to be not 100% fixed,
         see issue #9
 
-        :param key: key to query from time stats
-        :return: the value if existing or none
+        time_stats might be a function querying the server, so only call it once
         """
-        query_dict: Dict[str, float]
-        if callable(self.obj.time_stats):
-            query_dict = self.obj.time_stats()
-        else:
-            query_dict = self.obj.time_stats
-        return query_dict.get(key, None)
+        time_stats = self.obj.time_stats
+        if callable(time_stats):
+            return time_stats()
+        return time_stats
 
     @property
     def time_estimated(self) -> Optional[float]:
         """
         Time estimated in minutes
         """
-        if (time_estimate := self._get_from_time_stats("time_estimate")) is not None:
+        if (time_estimate := self._time_stats.get("time_estimate")) is not None:
             return time_estimate / 60
         else:
             logger.warning("Time Estimate is None")
@@ -218,34 +385,37 @@ class Issue:
         """
         Total time spent in minutes
         """
-        if (time_spend := self._get_from_time_stats("total_time_spent")) is not None:
+        if (time_spend := self._time_stats.get("total_time_spent")) is not None:
             return time_spend / 60
         else:
             logger.warning("Time spend is None")
             return None
 
-    @property
-    def assignees(self) -> List[str]:
+    @cached_property
+    def assignees(self) -> Tuple[str, ...]:
         """
-        list of Gitlab Assignees.
+        Gitlab Assignees.
 
-        Note in the community edition only one assignee is possible
+        Note in the community edition only one assignee is possible.
+        The same users are assigned to many issues, so the identifiers are interned
         """
-        return [get_user_identifier(user) for user in self.obj.assignees]
+        return tuple(
+            sys.intern(get_user_identifier(user)) for user in self.obj.assignees
+        )
 
-    @property
-    def labels(self) -> List[str]:
+    @cached_property
+    def labels(self) -> Tuple[str, ...]:
         """
-        list of labels
+        labels of the issue
         """
-        return self.obj.labels
+        return tuple(self.obj.labels)
 
     @property
     def full_ref(self) -> str:
         """
         give the full reference through which the issue can be accessed
         """
-        return self.obj.attributes['references']['full']
+        return _get_full_ref(_get_references(self.obj.attributes))
 
     @property
     def web_url(self) -> str:
@@ -254,7 +424,7 @@ class Issue:
         """
         return self.obj.web_url
 
-@lru_cache(10)
+
 def get_group_id_from_gitlab_project(project: Project) -> Optional[int]:
     """
     Get user id form gitlab project.
@@ -276,21 +446,234 @@ def get_group_id_from_gitlab_project(project: Project) -> Optional[int]:
         return int(namespace["id"])
 
 
-def get_gitlab_class(server: str, personal_token: Optional[str] = None) -> Gitlab:
+class GraphQLIssue:
+    """
+    Issue loaded with the GraphQL API
+
+    Offers the same attributes as the issues of python-gitlab, so it can be
+    wrapped by :class:`Issue` the same way
+    """
+
+    __slots__ = ["attributes"]
+
+    def __init__(self, attributes: Dict[str, Any]):
+        self.attributes = attributes
+
+    def __getattr__(self, item: str):
+        try:
+            return self.attributes[item]
+        except KeyError:
+            raise AttributeError(item) from None
+
+
+def _id_from_global_id(global_id: str) -> int:
+    """Convert a GraphQL global id like 'gid://gitlab/Issue/42' to 42"""
+    return int(global_id.rsplit("/", 1)[-1])
+
+
+def _graphql_to_rest_attributes(node: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert an issue node of the GraphQL API into the attributes
+    given by the REST API
+    """
+    tasks = node["taskCompletionStatus"] or {"count": 0, "completedCount": 0}
+    moved_to = node["movedTo"]
+    # GraphQL gives a timestamp, the REST API only the date
+    due_date = node["dueDate"][:10] if node["dueDate"] is not None else None
+    return {
+        "id": _id_from_global_id(node["id"]),
+        "iid": int(node["iid"]),
+        "project_id": node["projectId"],
+        "title": node["title"],
+        "description": node["description"],
+        "state": node["state"],
+        "web_url": node["webUrl"],
+        "references": {"full": node["reference"]},
+        "created_at": node["createdAt"],
+        "closed_at": node["closedAt"],
+        "due_date": due_date,
+        "moved_to_id": (
+            _id_from_global_id(moved_to["id"]) if moved_to is not None else None
+        ),
+        "time_stats": {
+            "time_estimate": node["timeEstimate"],
+            "total_time_spent": node["totalTimeSpent"],
+        },
+        "has_tasks": tasks["count"] > 0,
+        "task_completion_status": {
+            "count": tasks["count"],
+            "completed_count": tasks["completedCount"],
+        },
+        "assignees": node["assignees"]["nodes"],
+        "labels": [label["title"] for label in node["labels"]["nodes"]],
+    }
+
+
+def get_gitlab_class(
+    server: str,
+    personal_token: Optional[str] = None,
+    ssl_verify: bool = True,
+    ca_bundle: Optional[str] = None,
+) -> Gitlab:
+    """
+    Get the Gitlab API class
+
+    Args:
+        server: url of the gitlab instance
+        personal_token: personal access token, if None access anonymously
+        ssl_verify: verify the SSL certificate of the server
+        ca_bundle: path to a CA bundle used to verify the server certificate,
+                   i.e. for instances with a company certificate authority.
+                   If given, the certificate is verified regardless of ssl_verify
+    """
+    verify: Union[bool, str] = ca_bundle if ca_bundle is not None else ssl_verify
     if personal_token is None:
-        return Gitlab(server, ssl_verify=False)
+        gitlab = Gitlab(server, ssl_verify=verify)
     else:
-        return Gitlab(server, private_token=personal_token, ssl_verify=False)
-
+        gitlab = Gitlab(server, private_token=personal_token, ssl_verify=verify)
+    # Keep enough connections open for loading pages in parallel and retry
+    # failing connections instead of aborting the whole sync.
+    # Rate limits (429) are already retried by python-gitlab, so they are not
+    # retried here as well
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, respect_retry_after_header=False
+        ),
+    )
+    gitlab.session.mount("https://", adapter)
+    gitlab.session.mount("http://", adapter)
+    return gitlab
+
+
+def _list_all(manager: Any, **kwargs) -> List[Any]:
+    """
+    Get all objects of a python-gitlab list manager
 
-def get_group_issues(gitlab: Gitlab, group_id: int) -> List[Issue]:
+    The first page tells how many pages exist, the remaining ones are
+    requested in parallel as the time is spent waiting for the server.
+    If Gitlab does not give the number of pages (for very large collections)
+    the remaining pages are fetched one after another.
+    """
+    first_page = manager.list(iterator=True, per_page=PER_PAGE, **kwargs)
+    if getattr(first_page, "total_pages", None) is None:
+        if isinstance(first_page, list):
+            # python-gitlab ignored the iterator and only gave the first page
+            return manager.list(all=True, per_page=PER_PAGE, **kwargs)
+        return list(first_page)
+    # Only consume the objects of the first page, iterating further would
+    # make the list fetch the next page on its own
+    result = list(islice(first_page, min(first_page.per_page, first_page.total)))
+    if first_page.total_pages > 1:
+
+        def get_page(page: int) -> List[Any]:
+            return manager.list(page=page, per_page=PER_PAGE, **kwargs)
+
+        with ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS) as executor:
+            for page_objects in executor.map(
+                get_page, range(2, first_page.total_pages + 1)
+            ):
+                result += page_objects
+    return result
+
+
+def _get_issue_filters(
+    state: Optional[str], updated_after: Optional[datetime]
+) -> Dict[str, str]:
+    """
+    Give the filters for the issue list that are applied by the Gitlab server
+    """
+    filters: Dict[str, str] = {}
+    if state is not None:
+        filters["state"] = state
+    if updated_after is not None:
+        filters["updated_after"] = updated_after.isoformat()
+    return filters
+
+
+def get_group_issues(
+    gitlab: Gitlab,
+    group_id: int,
+    state: Optional[str] = None,
+    updated_after: Optional[datetime] = None,
+) -> List[Issue]:
+    """
+    Get the issues of a group
+
+    Args:
+        gitlab: the gitlab instance to query
+        group_id: id of the group
+        state: only give issues with this state ('opened' or 'closed'),
+               if None all issues are given
+        updated_after: only give issues updated after this point in time
+    """
     group = gitlab.groups.get(group_id, lazy=True)
-    return [Issue(issue) for issue in group.issues.list(all=True)]
+    return [
+        Issue(issue)
+        for issue in _list_all(group.issues, **_get_issue_filters(state, updated_after))
+    ]
 
 
-def get_project_issues(gitlab: Gitlab, project_id: int) -> List[Issue]:
+def get_project_issues(
+    gitlab: Gitlab,
+    project_id: int,
+    state: Optional[str] = None,
+    updated_after: Optional[datetime] = None,
+) -> List[Issue]:
+    """
+    Get the issues of a project
+
+    Args:
+        gitlab: the gitlab instance to query
+        project_id: id of the project
+        state: only give issues with this state ('opened' or 'closed'),
+               if None all issues are given
+        updated_after: only give issues updated after this point in time
+    """
     project = gitlab.projects.get(project_id)
+    group_id = get_group_id_from_gitlab_project(project)
     return [
-        Issue(issue, fixed_group_id=get_group_id_from_gitlab_project(project))
-        for issue in project.issues.list(all=True)
+        Issue(issue, fixed_group_id=group_id)
+        for issue in _list_all(
+            project.issues, **_get_issue_filters(state, updated_after)
+        )
     ]
+
+
+def get_group_issues_graphql(gitlab: Gitlab, group_id: int) -> List[Issue]:
+    """
+    Get the issues of a group with the GraphQL API
+
+    All data required for the sync is contained in the query, so unlike
+    the REST API no additional requests per issue (i.e. for the time stats)
+    are necessary.
+
+    :exceptions GraphQLQueryError
+    """
+    full_path = gitlab.groups.get(group_id).full_path
+    issues: List[Issue] = []
+    after: Optional[str] = None
+    while True:
+        # The GraphQL API always answers with JSON
+        result = cast(
+            Dict[str, Any],
+            gitlab.http_post(
+                f"{gitlab.url}/api/graphql",
+                post_data={
+                    "query": GROUP_ISSUES_QUERY,
+                    "variables": {"fullPath": full_path, "after": after},
+                },
+            ),
+        )
+        if errors := result.get("errors"):
+            raise GraphQLQueryError(
+                f"Could not query issues of group {group_id}: {errors}"
+            )
+        if (group := result["data"]["group"]) is None:
+            raise GraphQLQueryError(f"Group {full_path} could not be found")
+        page = group["issues"]
+        issues += [Issue.from_graphql(node) for node in page["nodes"]]
+        if not page["pageInfo"]["hasNextPage"]:
+            return issues
+        after = page["pageInfo"]["endCursor"]
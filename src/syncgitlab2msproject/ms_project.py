@@ -1,15 +1,15 @@
-import dateutil
 import pywintypes
 import win32com.client
-from datetime import datetime
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from enum import IntEnum
 from logging import getLogger
 from os import PathLike
-from typing import Any, List, Optional, Sequence, Union
+from typing import Any, Iterator, List, Optional, Sequence, Union
 from win32com.universal import com_error
 
 from .custom_types import ComMSProjectApplication, ComMSProjectProject
-from .decorators import make_none_safe
 from .exceptions import ClassNotInitiated, LoadingError, MSProjectValueSetError
 from .funcions import convert_to_int_or_raise_exception, raise_exception_if_not_datetime
 
@@ -31,25 +31,42 @@ class PjTaskFixedType(IntEnum):
     pjFixedWork = 2  # Fixed Work
 
 
-@make_none_safe
-def win2python_datetime(win32datetime: "pywintypes.datetime") -> datetime:
+def win2python_datetime(
+    win32datetime: Optional["pywintypes.datetime"],
+) -> Optional[datetime]:
     """
-    Convert MSProject time to Python time
+    Convert MSProject time to Python time, give None if None
 
-    might be a cumbersome to convert to string first but seems the only way
-    to be sure the timezone is correct
-    see http://timgolden.me.uk/python/win32_how_do_i/use-a-pytime-value.html
-    for an alternative.
-    This solution is taken from:
+    pywintypes.datetime already offers all fields, so the datetime is created
+    directly. The timezone is taken over as fixed offset, the same way it would
+    be given when converting to string first, see
     https://stackoverflow.com/questions/39028290/
     """
-    return dateutil.parser.parse(str(win32datetime))
-
-
-def na_win2py_datetime(win32datetime: "pywintypes.datetime") -> Optional[datetime]:
+    # Checked inline instead of using make_none_safe, as this is called
+    # for every date read from MS Project
+    if win32datetime is None:
+        return None
+    offset = win32datetime.utcoffset()
+    return datetime(
+        win32datetime.year,
+        win32datetime.month,
+        win32datetime.day,
+        win32datetime.hour,
+        win32datetime.minute,
+        win32datetime.second,
+        win32datetime.microsecond,
+        tzinfo=timezone(offset) if offset is not None else None,
+    )
+
+
+def na_win2py_datetime(
+    win32datetime: Optional["pywintypes.datetime"],
+) -> Optional[datetime]:
     """
-    Convert also NA datetime to Python Datetype, give None if NA
+    Convert also NA datetime to Python Datetype, give None if NA or None
     """
+    if win32datetime is None:
+        return None
     if isinstance(win32datetime, str) and win32datetime.lower() == "na":
         return None
     else:
@@ -66,6 +83,26 @@ def na_py2win_datetime(dt: Optional[datetime]) -> Union[datetime, str]:
         return dt
 
 
+def get_ms_project_application() -> ComMSProjectApplication:
+    """
+    Connect to MS Project with early binding
+
+    The generated wrapper knows the IDs of all properties, so they do not need
+    to be looked up by name for every access.
+    Note that with early binding the property names are case sensitive.
+    """
+    try:
+        return win32com.client.gencache.EnsureDispatch("MSProject.Application")
+    except (AttributeError, TypeError, ImportError, com_error) as e:
+        # Happens if the generated wrapper cache (gen_py) is outdated or
+        # corrupted or no wrapper can be generated for MS Project
+        logger.warning(
+            f"Could not use early binding for MS Project, falling back to late "
+            f"binding: {e}"
+        )
+        return win32com.client.Dispatch("MSProject.Application")
+
+
 def get_project_path(ms_project) -> str:
     return ms_project.Path + "\\" + ms_project.Name
 
@@ -80,9 +117,7 @@ class MSProject(Sequence[Optional["Task"]]):
     def __init__(self, doc_path: PathLike):
         self.project: ComMSProjectProject = None
         self._close_after: Optional[bool] = None
-        self.mpp: ComMSProjectApplication = win32com.client.Dispatch(
-            "MSProject.Application"
-        )
+        self.mpp: ComMSProjectApplication = get_ms_project_application()
         self.doc_path: PathLike = doc_path
 
     def __repr__(self):
@@ -131,6 +166,24 @@ class MSProject(Sequence[Optional["Task"]]):
         if self.project is not None:
             self.mpp.FileSave()
 
+    @contextmanager
+    def batch_updates(self) -> Iterator["MSProject"]:
+        """
+        Context in which many tasks can be changed efficiently
+
+        MS Project redraws the screen after every change, so this is disabled
+        within the context.
+        The calculation is kept automatic, as the sync reads values that
+        MS Project derives from the values written before (i.e. the percentage
+        after writing the actual work).
+        """
+        screen_updating = self.mpp.ScreenUpdating
+        self.mpp.ScreenUpdating = False
+        try:
+            yield self
+        finally:
+            self.mpp.ScreenUpdating = screen_updating
+
     def __len__(self) -> int:
         if self.project is None:
             raise ClassNotInitiated("Can't get length for a not loaded project")
@@ -138,7 +191,7 @@ class MSProject(Sequence[Optional["Task"]]):
 
     def add_task(self, name: str) -> "Task":
         ms_task = self.project.Tasks.Add(name)
-        return Task(self, ms_task.ID - 1)
+        return Task._from_com(self, ms_task.ID - 1, ms_task)
 
     def get_task(self, task_nr: int) -> Optional["Task"]:
         return self.project.Tasks(task_nr + 1)
@@ -152,6 +205,82 @@ class MSProject(Sequence[Optional["Task"]]):
         else:
             return Task(self, i)
 
+    def __iter__(self) -> Iterator[Optional["Task"]]:
+        """
+        Iterate over all tasks (None for empty rows)
+
+        Walks the task collection of MS Project once, instead of requesting every
+        task by its index
+        """
+        if self.project is None:
+            raise ClassNotInitiated("Can't iterate over a not loaded project")
+        for task_nr, ms_task in enumerate(self.project.Tasks):
+            if ms_task is None:
+                yield None
+            else:
+                yield Task._from_com(self, task_nr, ms_task)
+
+
+def _text_property(number: int) -> property:
+    """
+    Create the property to get or set the custom field Text<number> of a task
+    """
+    attribute = f"Text{number}"
+
+    def getter(self: "Task") -> str:
+        return getattr(self._get_task(), attribute)
+
+    def setter(self: "Task", value: str):
+        self._set_task_val(attribute, value)
+
+    return property(getter, setter, doc=f"get or sets the {attribute} Property")
+
+
+@dataclass(frozen=True)
+class TaskReference:
+    """
+    Values of a task that may refer to a Gitlab issue, used to find the issue
+
+    Read for every task, so it only contains the fields required for the lookup
+    """
+
+    __slots__ = ("text30", "text29", "hyperlink_address")
+
+    text30: str
+    text29: str
+    hyperlink_address: str
+
+
+@dataclass(frozen=True)
+class TaskSnapshot:
+    """
+    Values of a task read at once before it is synced
+
+    Reading from the snapshot does not require any call to MS Project
+    """
+
+    __slots__ = (
+        "name",
+        "text30",
+        "text29",
+        "text28",
+        "hyperlink_name",
+        "hyperlink_address",
+        "resource_names",
+        "work",
+        "has_children",
+    )
+
+    name: str
+    text30: str
+    text29: str
+    text28: str
+    hyperlink_name: str
+    hyperlink_address: str
+    resource_names: str
+    work: int
+    has_children: bool
+
 
 class Task:
     """
@@ -165,11 +294,19 @@ class Task:
     Properties naming follows PEP8 (lower case naming)
     """
 
-    __slots__ = ("_project", "_tasknr")
+    __slots__ = ("_project", "_tasknr", "_com_task")
 
     def __init__(self, project: MSProject, task_number: int):
         self._project = project
         self._tasknr = task_number
+        self._com_task: Any = None
+
+    @classmethod
+    def _from_com(cls, project: MSProject, task_number: int, ms_task: Any) -> "Task":
+        """Create the wrapper for an already known COM task object"""
+        task = cls(project, task_number)
+        task._com_task = ms_task
+        return task
 
     def __repr__(self):
         return f"<Task({self._project.__repr__()}, {self._tasknr}) '{self.name}'>"
@@ -178,7 +315,48 @@ class Task:
         return f"'{self.name}' (ID: {self.id})"
 
     def _get_task(self):
-        return self._project.get_task(self._tasknr)
+        """
+        Give the COM object of the task
+
+        The object is only requested once from MS Project, as every request
+        is a call to another process
+        """
+        if self._com_task is None:
+            self._com_task = self._project.get_task(self._tasknr)
+        return self._com_task
+
+    def reference(self) -> TaskReference:
+        """
+        Read the values required for finding the related issue at once
+        """
+        task = self._get_task()
+        return TaskReference(
+            text30=task.Text30,
+            text29=task.Text29,
+            hyperlink_address=task.HyperlinkAddress,
+        )
+
+    def snapshot(self, reference: Optional[TaskReference] = None) -> TaskSnapshot:
+        """
+        Read the values required for syncing the task at once
+
+        Args:
+            reference: already read reference values of the task, read if not given
+        """
+        if reference is None:
+            reference = self.reference()
+        task = self._get_task()
+        return TaskSnapshot(
+            name=task.Name,
+            text30=reference.text30,
+            text29=reference.text29,
+            text28=task.Text28,
+            hyperlink_name=task.Hyperlink,
+            hyperlink_address=reference.hyperlink_address,
+            resource_names=task.ResourceNames,
+            work=task.Work,
+            has_children=len(task.OutlineChildren) > 0,
+        )
 
     def _set_task_val(self, attribute: str, value: Any):
         """
@@ -279,11 +457,11 @@ class Task:
     def duration(self) -> Optional[int]:
         """Gets  the duration (in minutes) of a task.
         Read-only for summary tasks. Read/write Variant."""
-        return self._get_task().duration
+        return self._get_task().Duration
 
     @duration.setter
     def duration(self, value: int):
-        self._set_task_val("duration", convert_to_int_or_raise_exception(value))
+        self._set_task_val("Duration", convert_to_int_or_raise_exception(value))
 
     @property
     def percent_complete(self) -> int:
@@ -368,275 +546,36 @@ class Task:
                 "Outline Level has to be an int larger then zero."
             )
 
-    @property
-    def text1(self) -> str:
-        """get or sets the Text1 Property"""
-        return self._get_task().Text1
-
-    @text1.setter
-    def text1(self, value: str):
-        self._set_task_val("Text1", value)
-
-    @property
-    def text2(self) -> str:
-        """get or sets the Text2 Property"""
-        return self._get_task().Text2
-
-    @text2.setter
-    def text2(self, value: str):
-        self._set_task_val("Text2", value)
-
-    @property
-    def text3(self) -> str:
-        """get or sets the Text3 Property"""
-        return self._get_task().Text3
-
-    @text3.setter
-    def text3(self, value: str):
-        self._set_task_val("Text3", value)
-
-    @property
-    def text4(self) -> str:
-        """get or sets the Text4 Property"""
-        return self._get_task().Text4
-
-    @text4.setter
-    def text4(self, value: str):
-        self._set_task_val("Text4", value)
-
-    @property
-    def text5(self) -> str:
-        """get or sets the Text5 Property"""
-        return self._get_task().Text5
-
-    @text5.setter
-    def text5(self, value: str):
-        self._set_task_val("Text5", value)
-
-    @property
-    def text6(self) -> str:
-        """get or sets the Text6 Property"""
-        return self._get_task().Text6
-
-    @text6.setter
-    def text6(self, value: str):
-        self._set_task_val("Text6", value)
-
-    @property
-    def text7(self) -> str:
-        """get or sets the Text7 Property"""
-        return self._get_task().Text7
-
-    @text7.setter
-    def text7(self, value: str):
-        self._set_task_val("Text7", value)
-
-    @property
-    def text8(self) -> str:
-        """get or sets the Text8 Property"""
-        return self._get_task().Text8
-
-    @text8.setter
-    def text8(self, value: str):
-        self._set_task_val("Text8", value)
-
-    @property
-    def text9(self) -> str:
-        """get or sets the Text9 Property"""
-        return self._get_task().Text9
-
-    @text9.setter
-    def text9(self, value: str):
-        self._set_task_val("Text9", value)
-
-    @property
-    def text10(self) -> str:
-        """get or sets the Text10 Property"""
-        return self._get_task().Text10
-
-    @text10.setter
-    def text10(self, value: str):
-        self._set_task_val("Text10", value)
-
-    @property
-    def text11(self) -> str:
-        """get or sets the Text11 Property"""
-        return self._get_task().Text11
-
-    @text11.setter
-    def text11(self, value: str):
-        self._set_task_val("Text11", value)
-
-    @property
-    def text12(self) -> str:
-        """get or sets the Text12 Property"""
-        return self._get_task().Text12
-
-    @text12.setter
-    def text12(self, value: str):
-        self._set_task_val("Text12", value)
-
-    @property
-    def text13(self) -> str:
-        """get or sets the Text13 Property"""
-        return self._get_task().Text13
-
-    @text13.setter
-    def text13(self, value: str):
-        self._set_task_val("Text13", value)
-
-    @property
-    def text14(self) -> str:
-        """get or sets the Text14 Property"""
-        return self._get_task().Text14
-
-    @text14.setter
-    def text14(self, value: str):
-        self._set_task_val("Text14", value)
-
-    @property
-    def text15(self) -> str:
-        """get or sets the Text15 Property"""
-        return self._get_task().Text15
-
-    @text15.setter
-    def text15(self, value: str):
-        self._set_task_val("Text15", value)
-
-    @property
-    def text16(self) -> str:
-        """get or sets the Text16 Property"""
-        return self._get_task().Text16
-
-    @text16.setter
-    def text16(self, value: str):
-        self._set_task_val("Text16", value)
-
-    @property
-    def text17(self) -> str:
-        """get or sets the Text17 Property"""
-        return self._get_task().Text17
-
-    @text17.setter
-    def text17(self, value: str):
-        self._set_task_val("Text17", value)
-
-    @property
-    def text18(self) -> str:
-        """get or sets the Text18 Property"""
-        return self._get_task().Text18
-
-    @text18.setter
-    def text18(self, value: str):
-        self._set_task_val("Text18", value)
-
-    @property
-    def text19(self) -> str:
-        """get or sets the Text19 Property"""
-        return self._get_task().Text19
-
-    @text19.setter
-    def text19(self, value: str):
-        self._set_task_val("Text19", value)
-
-    @property
-    def text20(self) -> str:
-        """get or sets the Text20 Property"""
-        return self._get_task().Text20
-
-    @text20.setter
-    def text20(self, value: str):
-        self._set_task_val("Text20", value)
-
-    @property
-    def text21(self) -> str:
-        """get or sets the Text21 Property"""
-        return self._get_task().Text21
-
-    @text21.setter
-    def text21(self, value: str):
-        self._set_task_val("Text21", value)
-
-    @property
-    def text22(self) -> str:
-        """get or sets the Text22 Property"""
-        return self._get_task().Text22
-
-    @text22.setter
-    def text22(self, value: str):
-        self._set_task_val("Text22", value)
-
-    @property
-    def text23(self) -> str:
-        """get or sets the Text23 Property"""
-        return self._get_task().Text23
-
-    @text23.setter
-    def text23(self, value: str):
-        self._set_task_val("Text23", value)
-
-    @property
-    def text24(self) -> str:
-        """get or sets the Text24 Property"""
-        return self._get_task().Text24
-
-    @text24.setter
-    def text24(self, value: str):
-        self._set_task_val("Text24", value)
-
-    @property
-    def text25(self) -> str:
-        """get or sets the Text25 Property"""
-        return self._get_task().Text25
-
-    @text25.setter
-    def text25(self, value: str):
-        self._set_task_val("Text25", value)
-
-    @property
-    def text26(self) -> str:
-        """get or sets the Text26 Property"""
-        return self._get_task().Text26
-
-    @text26.setter
-    def text26(self, value: str):
-        self._set_task_val("Text26", value)
-
-    @property
-    def text27(self) -> str:
-        """get or sets the Text27 Property"""
-        return self._get_task().Text27
-
-    @text27.setter
-    def text27(self, value: str):
-        self._set_task_val("Text27", value)
-
-    @property
-    def text28(self) -> str:
-        """get or sets the Text28 Property"""
-        return self._get_task().Text28
-
-    @text28.setter
-    def text28(self, value: str):
-        self._set_task_val("Text28", value)
-
-    @property
-    def text29(self) -> str:
-        """get or sets the Text29 Property"""
-        return self._get_task().Text29
-
-    @text29.setter
-    def text29(self, value: str):
-        self._set_task_val("Text29", value)
-
-    @property
-    def text30(self) -> str:
-        """get or sets the Text30 Property"""
-        return self._get_task().Text30
-
-    @text30.setter
-    def text30(self, value: str):
-        self._set_task_val("Text30", value)
+    text1 = _text_property(1)
+    text2 = _text_property(2)
+    text3 = _text_property(3)
+    text4 = _text_property(4)
+    text5 = _text_property(5)
+    text6 = _text_property(6)
+    text7 = _text_property(7)
+    text8 = _text_property(8)
+    text9 = _text_property(9)
+    text10 = _text_property(10)
+    text11 = _text_property(11)
+    text12 = _text_property(12)
+    text13 = _text_property(13)
+    text14 = _text_property(14)
+    text15 = _text_property(15)
+    text16 = _text_property(16)
+    text17 = _text_property(17)
+    text18 = _text_property(18)
+    text19 = _text_property(19)
+    text20 = _text_property(20)
+    text21 = _text_property(21)
+    text22 = _text_property(22)
+    text23 = _text_property(23)
+    text24 = _text_property(24)
+    text25 = _text_property(25)
+    text26 = _text_property(26)
+    text27 = _text_property(27)
+    text28 = _text_property(28)
+    text29 = _text_property(29)
+    text30 = _text_property(30)
 
     @property
     def type(self) -> PjTaskFixedType:
@@ -1,6 +1,18 @@
 import win32com.universal
 from logging import getLogger
-from typing import Callable, Dict, List, Optional, Type, overload
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NoReturn,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    overload,
+)
 
 from syncgitlab2msproject.custom_types import WebURL
 from syncgitlab2msproject.helper_classes import TaskTyperSetter
@@ -12,11 +24,12 @@ from .exceptions import (
     MSProjectValueSetError,
 )
 from .gitlab_issues import Issue
-from .ms_project import MSProject, Task
+from .ms_project import MSProject, Task, TaskReference
 
 logger = getLogger(f"{__package__}.{__name__}")
 
 GL_PREFIX = "!!DO NOT CHANGE!! Gitlab:"
+GL_PREFIX_LEN = len(GL_PREFIX)
 
 DEFAULT_DURATION = 8 * 60
 
@@ -37,18 +50,26 @@ def get_issue_web_url(issue: Issue) -> WebURL:
     return WebURL(issue.web_url)
 
 
+def get_issue_ref_text(issue: Issue) -> str:
+    """give the text that is saved in a MS Project task to refer to the issue"""
+    return f"{GL_PREFIX}{issue.id};{issue.group_id};{issue.project_id};{issue.iid}"
+
+
 def set_issue_ref_to_task(task: Task, issue: Issue) -> None:
     """set reference to gitlab issues in MS Project task"""
-    task.text30 = (
-        f"{GL_PREFIX}{issue.id};{issue.group_id};{issue.project_id};{issue.iid}"
-    )
+    task.text30 = get_issue_ref_text(issue)
 
 
-def get_issue_ref_from_task(task: Optional[Task]) -> Optional[IssueRef]:
+def get_issue_ref_from_task(
+    task: Optional[Union[Task, TaskReference]]
+) -> Optional[IssueRef]:
     """get reference to gitlab issues from MS Project task"""
-    if task is not None and task.text30 and task.text30.startswith(GL_PREFIX):
-        values = task.text30[len(GL_PREFIX) :].split(";")
-        return IssueRef(int(values[0]))
+    if task is None:
+        return None
+    # Read only once, as every access is a call to MS Project
+    text30 = task.text30
+    if text30 and text30.startswith(GL_PREFIX):
+        return IssueRef(int(text30[GL_PREFIX_LEN:].split(";", 1)[0]))
     return None
 
 
@@ -56,7 +77,9 @@ def is_gitlab_hyperlink(url: WebURL, gitlab_url: WebURL) -> bool:
     return url.startswith(gitlab_url)
 
 
-def get_weburl_from_task(task: Optional[Task], gitlab_url: WebURL) -> Optional[WebURL]:
+def get_weburl_from_task(
+    task: Optional[Union[Task, TaskReference]], gitlab_url: WebURL
+) -> Optional[WebURL]:
     """
     Get the weburl from MS Project Task (is saved as hyperlink)
     """
@@ -85,6 +108,7 @@ def update_task_with_issue_data(
     parent_ids: Optional[List[IssueRef]] = None,
     ignore_issue: bool = False,
     is_add: bool = False,
+    reference: Optional[TaskReference] = None,
 ) -> List[IssueRef]:
     """
     Update task with issue data
@@ -99,59 +123,94 @@ def update_task_with_issue_data(
         ignore_issue: only return the related (and moved) ids but do not really sync
                       This is required so we can ignored also moved issues correctly
         is_add:
+        reference: already read reference values of the task
 
     Returns:
         list of IssueRefs that
     """
     if parent_ids is None:
-        parent_ids = [get_issue_ref_id(issue)]
-    else:
-        parent_ids += [get_issue_ref_id(issue)]
+        parent_ids = []
+    parent_ids.append(get_issue_ref_id(issue))
+
+    if ignore_issue:
+        # Only collect the references of the issue it was moved to (if any)
+        # without touching the task
+        while issue.moved_to_id is not None:
+            try:
+                moved_ref = issue.moved_reference
+            except MovedIssueNotDefined:
+                break
+            assert moved_ref is not None
+            issue = moved_ref
+            parent_ids.append(get_issue_ref_id(issue))
+        return parent_ids
 
-    if (moved_ref := issue.moved_reference) is not None:
-        assert moved_ref is not None
-        try:
-            return update_task_with_issue_data(
-                task,
-                moved_ref,
-                task_type_setter,
-                parent_ids=parent_ids,
-                ignore_issue=ignore_issue,
-            )
-        except MovedIssueNotDefined:
-            logger.warning(
-                f"Issue {issue} was moved outside of context."
-                f" Ignoring the issue. Please update the task {task} manually!"
-            )
-    elif not ignore_issue:
-        set_issue_ref_to_task(task, issue)
+    try:
+        moved_ref = issue.moved_reference
+    except MovedIssueNotDefined:
+        logger.warning(
+            f"Issue {issue} was moved outside of context."
+            f" Ignoring the issue. Please update the task {task} manually!"
+        )
+        return parent_ids
+    if moved_ref is not None:
+        return update_task_with_issue_data(
+            task,
+            moved_ref,
+            task_type_setter,
+            parent_ids=parent_ids,
+            reference=reference,
+        )
+    else:
         try:
+            # Only read once the task is known to be synced
+            snapshot = task.snapshot(reference)
+            data = issue.view
+            # Only write values that changed, as every write is a call to
+            # MS Project that also makes it recalculate the project
+            if (ref_text := get_issue_ref_text(issue)) != snapshot.text30:
+                task.text30 = ref_text
             type_setter = task_type_setter(issue)
             type_setter.set_task_type_before_sync(task, is_add)
-            task.name = issue.title
+            if data.title != snapshot.name:
+                task.name = data.title
             #task.notes = issue.description
-            if issue.due_date is not None:
-                task.deadline = issue.due_date
-            if not task.has_children:
+            if data.due_date is not None:
+                task.deadline = data.due_date
+            if not snapshot.has_children:
                 if (estimated := issue.time_estimated) is not None:
-                    task.work = int(estimated)
+                    if int(estimated) != snapshot.work:
+                        task.work = int(estimated)
             # Update duration in case it seems to be default
             if task.duration == DEFAULT_DURATION and task.estimated:
                 if task.work > 0:
                     task.duration = task.work
-            if (time_spend := issue.time_spent_total) is not None:
-                task.actual_work = time_spend
-            if issue.has_tasks or task.percent_complete == 0:
-                task.percent_complete = issue.percentage_tasks_done
-            task.hyperlink_name = issue.full_ref
-            task.hyperlink_address = issue.web_url
-            task.text29 = issue.web_url
-            task.text28 = "; ".join([f'"{label}"' for label in issue.labels])
-            task.actual_start = issue.created_at
-            if len(issue.assignees):
-                task.resource_names = issue.assignees[0]
-            if issue.is_closed:
-                task.actual_finish = issue.closed_at
+            if (time_spend := data.time_spent_total) is not None:
+                # Read live, writing the work or duration can change it
+                if int(time_spend) != task.actual_work:
+                    task.actual_work = time_spend
+            # Writing the actual work changes the percentage, so read it again
+            percent_complete = task.percent_complete
+            if data.has_tasks or percent_complete == 0:
+                if (percentage := data.percentage_tasks_done) != percent_complete:
+                    task.percent_complete = percentage
+            if data.full_ref != snapshot.hyperlink_name:
+                task.hyperlink_name = data.full_ref
+            web_url = data.web_url
+            if web_url != snapshot.hyperlink_address:
+                task.hyperlink_address = web_url
+            if web_url != snapshot.text29:
+                task.text29 = web_url
+            # Same as joining every quoted label but without formatting each one
+            labels = '"' + '"; "'.join(data.labels) + '"' if data.labels else ""
+            if labels != snapshot.text28:
+                task.text28 = labels
+            task.actual_start = data.created_at
+            if assignees := data.assignees:
+                if assignees[0] != snapshot.resource_names:
+                    task.resource_names = assignees[0]
+            if data.is_closed:
+                task.actual_finish = data.closed_at
             type_setter.set_task_type_after_sync(task)
         except (MSProjectValueSetError, win32com.universal.com_error) as e:
             logger.error(
@@ -172,31 +231,70 @@ def add_issue_as_task_to_project(
     update_task_with_issue_data(task, issue, task_type_setter, is_add=True)
 
 
+def _raise_duplicated_reference(
+    issues: List[Issue], get_reference: Callable[[Issue], Any], name: str
+) -> NoReturn:
+    """
+    Find the issues that share the same reference and raise an exception
+
+    :exceptions IssueReferenceDuplicated
+    """
+    seen: Dict[Any, Issue] = {}
+    for issue in issues:
+        reference = get_reference(issue)
+        if reference in seen:
+            raise IssueReferenceDuplicated(
+                f"{name} {reference} was already defined! "
+                f"{seen[reference]} and {issue} "
+                f"share the same {name}"
+            )
+        seen[reference] = issue
+    raise AssertionError("Expected duplicated references but found none")
+
+
 class IssueFinder:
     def __init__(self, issues: List[Issue]):
+        """
+        Set up all references to locate later on
+
+        All references and the moved issues are collected in a single pass.
+        Duplicates are detected by comparing the sizes of the dictionaries, only
+        in the error case the issues are searched for the duplicate.
+
+        :exceptions IssueReferenceDuplicated
+        """
         # Create Dictionary of all IDs to find moved ones and relate existing
         self.ref_id_to_issue: Dict[IssueRef, Issue] = {}
         # We also try to sync according to the weburl but only in a second step
         self.web_url_to_issue: Dict[WebURL, Issue] = {}
+        # Issues (with their reference id) that have to exist as task
+        self.non_moved: List[Tuple[IssueRef, Issue]] = []
+        self._moved: List[Issue] = []
         for issue in issues:
-            """ Set up all references to locate later on"""
             ref_id = get_issue_ref_id(issue)
-            if ref_id in self.ref_id_to_issue:
-                raise IssueReferenceDuplicated(
-                    f"Reference ID {ref_id} was already defined! "
-                    f"{self.ref_id_to_issue[ref_id]} and {issue} "
-                    f"share the same Reference ID"
-                )
             self.ref_id_to_issue[ref_id] = issue
+            self.web_url_to_issue[get_issue_web_url(issue)] = issue
+            if issue.moved_to_id is None:
+                self.non_moved.append((ref_id, issue))
+            else:
+                self._moved.append(issue)
+        if len(self.ref_id_to_issue) != len(issues):
+            _raise_duplicated_reference(issues, get_issue_ref_id, "Reference ID")
+        if len(self.web_url_to_issue) != len(issues):
+            _raise_duplicated_reference(issues, get_issue_web_url, "Web URL")
 
-            web_url = get_issue_web_url(issue)
-            if web_url in self.web_url_to_issue:
-                raise IssueReferenceDuplicated(
-                    f"Web URL {web_url} was already defined! "
-                    f"{self.web_url_to_issue[web_url]} and {issue} "
-                    f"share the same Web URL"
-                )
-            self.web_url_to_issue[web_url] = issue
+    def link_moved_issues(self) -> None:
+        """
+        Set the moved reference of all moved issues whose new issue was loaded
+
+        Issues moved to an issue that was not loaded stay without reference,
+        they are reported while syncing.
+        """
+        for issue in self._moved:
+            assert issue.moved_to_id is not None
+            moved_ref = self.ref_id_to_issue.get(IssueRef(issue.moved_to_id))
+            if moved_ref is not None:
+                issue.moved_reference = moved_ref
 
     # Overload to make mypy aware of the fact that only None is given
     # once the id is none
@@ -230,10 +328,26 @@ class IssueFinder:
 
 
 def find_related_issue(
-    task: Task, find_issue: IssueFinder, gitlab_url: WebURL
+    task: Task,
+    find_issue: IssueFinder,
+    gitlab_url: WebURL,
+    reference: Optional[TaskReference] = None,
 ) -> Optional[Issue]:
+    """
+    Find the issue the task refers to
+
+    Args:
+        task: MS Project Task to find the issue for
+        find_issue: finder with all issues loaded from gitlab
+        gitlab_url: the gitlab instance url
+        reference: reference values of the task, read if not given
+    """
+    if reference is None:
+        reference = task.reference()
     try:
-        if (issue := find_issue.by_ref_id(get_issue_ref_from_task(task))) is not None:
+        if (
+            issue := find_issue.by_ref_id(get_issue_ref_from_task(reference))
+        ) is not None:
             return issue
     except KeyError as key:
         logger.warning(
@@ -242,7 +356,7 @@ def find_related_issue(
         )
     try:
         if (
-            issue := find_issue.by_web_url(get_weburl_from_task(task, gitlab_url))
+            issue := find_issue.by_web_url(get_weburl_from_task(reference, gitlab_url))
         ) is not None:
             return issue
     except KeyError as key:
@@ -268,62 +382,59 @@ def sync_gitlab_issues_to_ms_project(
         gitlab_url: the gitlab istance url to check url found in MS project against
         include_issue: Include issue in sync, if None include everything
     """
-    if include_issue is None:
-
-        def always_true(x: Issue):
-            return True
-
-        include_issue = always_true
-
     ref_issue: Optional[Issue]
     # Keep track of already synced issues
-    synced: List[IssueRef] = []
+    synced: Set[IssueRef] = set()
 
     # create finder
     find_issue = IssueFinder(issues)
 
     # Find moved issues and reference them
-    non_moved: List[IssueRef] = []
-    for issue in issues:
-        if (ref_int_id := issue.moved_to_id) is not None:
-            if (ref_issue := find_issue.by_ref_id(IssueRef(ref_int_id))) is not None:
-                issue.moved_reference = ref_issue
-        else:
-            non_moved.append(get_issue_ref_id(issue))
-
-    # get existing references and update them
-    for task in tasks:
-        if task is None:
-            continue
-        ref_issue = find_related_issue(task, find_issue, gitlab_url)
-
-        if ref_issue is None:
-            logger.info(
-                f"Not Syncing {task} as a not reference "
-                f"to an gitlab issue could be found"
-            )
-        else:
-            ignore_issue = False
-            if not include_issue(ref_issue):
+    find_issue.link_moved_issues()
+    non_moved = find_issue.non_moved
+
+    # Do not let MS Project redraw the screen for every change
+    with tasks.batch_updates():
+        # get existing references and update them
+        for task in tasks:
+            if task is None:
+                continue
+            # Only read the values required to find the issue for every task
+            reference = task.reference()
+            ref_issue = find_related_issue(task, find_issue, gitlab_url, reference)
+
+            if ref_issue is None:
                 logger.info(
-                    f"Ignoring task {task} as issue {ref_issue} "
-                    f"has been marked to be ignored"
+                    f"Not Syncing {task} as a not reference "
+                    f"to an gitlab issue could be found"
                 )
-                ignore_issue = True
             else:
-                logger.info(f"Syncing {ref_issue} into {task}")
-            # We want to not have the ignored task popping up in issues that need to be
-            # added and we also want make sure that moved ignored issues are handled
-            # correctly
-            synced += update_task_with_issue_data(
-                task, ref_issue, task_type_setter, ignore_issue=ignore_issue
-            )
+                ignore_issue = False
+                if include_issue is not None and not include_issue(ref_issue):
+                    logger.info(
+                        f"Ignoring task {task} as issue {ref_issue} "
+                        f"has been marked to be ignored"
+                    )
+                    ignore_issue = True
+                else:
+                    logger.info(f"Syncing {ref_issue} into {task}")
+                # We want to not have the ignored task popping up in issues that need
+                # to be added and we also want make sure that moved ignored issues
+                # are handled correctly
+                synced.update(
+                    update_task_with_issue_data(
+                        task,
+                        ref_issue,
+                        task_type_setter,
+                        ignore_issue=ignore_issue,
+                        reference=reference,
+                    )
+                )
 
-    # adding everything that was not synced and is not duplicate
-    for ref_id in non_moved:
-        if ref_id not in synced:
-            if (ref_issue := find_issue.by_ref_id(ref_id)) is not None:
-                if not include_issue(ref_issue):
+        # adding everything that was not synced and is not duplicate
+        for ref_id, ref_issue in non_moved:
+            if ref_id not in synced:
+                if include_issue is not None and not include_issue(ref_issue):
                     logger.info(
                         f"Do not add issue {ref_issue} "
                         f"as it has been marked to be ignored."
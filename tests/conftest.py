@@ -1,10 +1,51 @@
 # -*- coding: utf-8 -*-
 """
-    Dummy conftest.py for syncgitlab2msproject.
+    conftest.py for syncgitlab2msproject.
 
-    If you don't know what this is for, just leave it empty.
+    Fixtures shared by the tests.
     Read more about conftest.py under:
     https://pytest.org/latest/plugins.html
 """
 
-# import pytest
+import pytest
+
+from types import SimpleNamespace
+from typing import Any, Callable
+
+from syncgitlab2msproject.gitlab_issues import Issue
+
+
+@pytest.fixture
+def make_issue() -> Callable[..., Issue]:
+    """
+    Give a factory creating issues without contacting a gitlab instance
+
+    The keyword arguments overwrite the attributes of the python-gitlab issue
+    """
+
+    def factory(issue_id: int, **kwargs: Any) -> Issue:
+        attributes = dict(
+            id=issue_id,
+            iid=issue_id,
+            project_id=3,
+            group_id=5,
+            title=f"Issue {issue_id}",
+            description="",
+            state="opened",
+            created_at="2020-10-01T10:11:12.345Z",
+            closed_at=None,
+            due_date="2020-11-01",
+            moved_to_id=None,
+            assignees=[{"name": "Carli"}],
+            labels=["bug", "to do"],
+            has_tasks=False,
+            task_completion_status={"count": 0, "completed_count": 0},
+            time_stats={"time_estimate": 7200, "total_time_spent": 3600},
+            web_url=f"https://gitlab.com/group/project/-/issues/{issue_id}",
+            references={"full": f"group/project#{issue_id}"},
+        )
+        attributes.update(kwargs)
+        obj = SimpleNamespace(attributes=attributes, **attributes)
+        return Issue(obj)
+
+    return factory
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from datetime import datetime
+
+from syncgitlab2msproject import cli
+from syncgitlab2msproject.cli import parse_args
+from syncgitlab2msproject.exceptions import GraphQLQueryError
+
+__author__ = "Carli"
+__copyright__ = "Carli"
+__license__ = "MIT"
+
+POSITIONAL = ["group", "1", "project.mpp"]
+
+
+def test_issue_filters():
+    args = parse_args(
+        ["--state", "opened", "--updated-after", "2021-01-31"] + POSITIONAL
+    )
+    assert args.state == "opened"
+    assert args.updated_after == datetime(2021, 1, 31)
+
+
+def test_issue_filters_default():
+    args = parse_args(POSITIONAL)
+    assert args.state is None
+    assert args.updated_after is None
+
+
+@pytest.mark.parametrize(
+    "options",
+    [["--state", "opened"], ["--updated-after", "2021-01-31"]],
+)
+def test_issue_filters_with_graphql(options):
+    with pytest.raises(SystemExit):
+        parse_args(["--graphql"] + options + POSITIONAL)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [["--state", "merged"], ["--updated-after", "yesterday"]],
+)
+def test_invalid_issue_filters(options):
+    with pytest.raises(SystemExit):
+        parse_args(options + POSITIONAL)
+
+
+def test_graphql():
+    assert parse_args(["--graphql"] + POSITIONAL).graphql
+    assert not parse_args(POSITIONAL).graphql
+
+
+def test_graphql_for_project():
+    with pytest.raises(SystemExit):
+        parse_args(["--graphql", "project", "1", "project.mpp"])
+
+
+def test_graphql_error(monkeypatch, tmp_path):
+    def raise_error(*args, **kwargs):
+        raise GraphQLQueryError("Query failed")
+
+    monkeypatch.setattr(cli, "get_group_issues_graphql", raise_error)
+    project_file = tmp_path / "project.mpp"
+    project_file.touch()
+    with pytest.raises(SystemExit) as exc_info:
+        cli.main(["--graphql", "group", "1", str(project_file)])
+    assert exc_info.value.code == 65
+
+
+def test_ssl_options_default():
+    args = parse_args(POSITIONAL)
+    assert args.ssl_verify
+    assert args.ca_bundle is None
+
+
+def test_ssl_options():
+    assert not parse_args(["--no-ssl-verify"] + POSITIONAL).ssl_verify
+    assert parse_args(["--ca-bundle", "ca.pem"] + POSITIONAL).ca_bundle == "ca.pem"
+
+
+def test_ca_bundle_without_ssl_verify():
+    with pytest.raises(SystemExit):
+        parse_args(["--ca-bundle", "ca.pem", "--no-ssl-verify"] + POSITIONAL)
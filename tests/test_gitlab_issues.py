@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from syncgitlab2msproject.gitlab_issues import (
+    PER_PAGE,
+    Issue,
+    _graphql_to_rest_attributes,
+    _list_all,
+    _parse_iso,
+)
+
+__author__ = "Carli"
+__copyright__ = "Carli"
+__license__ = "MIT"
+
+
+class FakeRESTObjectList:
+    """
+    Behaves like the list returned by python-gitlab with `iterator=True`
+
+    Iterating over it gives all objects, not only the ones of the first page
+    """
+
+    def __init__(self, objects: List[int], with_headers: bool):
+        self._objects = objects
+        self.per_page: Optional[int] = PER_PAGE if with_headers else None
+        self.total: Optional[int] = len(objects) if with_headers else None
+        self.total_pages: Optional[int] = (
+            max(1, -(-len(objects) // PER_PAGE)) if with_headers else None
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._objects)
+
+
+class FakeManager:
+    """
+    Minimal python-gitlab list manager recording all calls of `list`
+    """
+
+    def __init__(
+        self, objects: List[int], with_headers: bool = True, iterator: bool = True
+    ):
+        self.objects = objects
+        self.with_headers = with_headers
+        # Old python-gitlab versions do not know the iterator argument
+        self.iterator = iterator
+        self.calls: List[Dict[str, Any]] = []
+
+    def list(self, **kwargs):
+        self.calls.append(kwargs)
+        if kwargs.get("all"):
+            return list(self.objects)
+        if (page := kwargs.get("page")) is not None:
+            per_page = kwargs["per_page"]
+            return self.objects[(page - 1) * per_page : page * per_page]
+        if kwargs.get("iterator") and self.iterator:
+            return FakeRESTObjectList(self.objects, self.with_headers)
+        return self.objects[: kwargs["per_page"]]
+
+
+@pytest.mark.parametrize("count", [0, 1, PER_PAGE])
+def test_list_all_single_page(count: int):
+    manager = FakeManager(list(range(count)))
+    assert _list_all(manager, state="opened") == list(range(count))
+    assert manager.calls == [
+        {"iterator": True, "per_page": PER_PAGE, "state": "opened"}
+    ]
+
+
+@pytest.mark.parametrize("count", [PER_PAGE + 1, 5 * PER_PAGE, 12 * PER_PAGE - 3])
+def test_list_all_multiple_pages(count: int):
+    manager = FakeManager(list(range(count)))
+    assert _list_all(manager, state="opened") == list(range(count))
+    pages = sorted(call["page"] for call in manager.calls if "page" in call)
+    assert pages == list(range(2, -(-count // PER_PAGE) + 1))
+    assert all(call["state"] == "opened" for call in manager.calls)
+
+
+def test_list_all_without_headers():
+    manager = FakeManager(list(range(3 * PER_PAGE)), with_headers=False)
+    assert _list_all(manager) == list(range(3 * PER_PAGE))
+    assert len(manager.calls) == 1
+
+
+def test_list_all_iterator_not_supported():
+    manager = FakeManager(list(range(3 * PER_PAGE)), iterator=False)
+    assert _list_all(manager) == list(range(3 * PER_PAGE))
+    assert manager.calls[-1] == {"all": True, "per_page": PER_PAGE}
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (
+            "2020-10-01T10:11:12.345Z",
+            datetime(2020, 10, 1, 10, 11, 12, 345000, tzinfo=timezone.utc),
+        ),
+        (
+            "2020-10-01T10:11:12.345+02:00",
+            datetime(
+                2020, 10, 1, 10, 11, 12, 345000, tzinfo=timezone(timedelta(hours=2))
+            ),
+        ),
+        ("2020-11-01", datetime(2020, 11, 1)),
+    ],
+)
+def test_parse_iso(value: str, expected: datetime):
+    parsed = _parse_iso(value)
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.parametrize(
+    "completed, count, expected",
+    [(0, 0, 0), (0, 3, 0), (1, 3, 33), (2, 3, 67), (1, 8, 13), (3, 8, 38), (4, 4, 100)],
+)
+def test_percentage_tasks_done(
+    make_issue: Callable[..., Issue], completed: int, count: int, expected: int
+):
+    issue = make_issue(
+        1,
+        has_tasks=count > 0,
+        task_completion_status={"count": count, "completed_count": completed},
+    )
+    assert issue.percentage_tasks_done == expected
+
+
+def test_percentage_tasks_done_closed(make_issue: Callable[..., Issue]):
+    issue = make_issue(
+        1,
+        state="closed",
+        has_tasks=True,
+        task_completion_status={"count": 3, "completed_count": 1},
+    )
+    assert issue.percentage_tasks_done == 100
+
+
+def test_percentage_tasks_done_closed_moved(make_issue: Callable[..., Issue]):
+    issue = make_issue(1, state="closed", moved_to_id=2)
+    moved_to = make_issue(
+        2,
+        has_tasks=True,
+        task_completion_status={"count": 4, "completed_count": 1},
+    )
+    issue.moved_reference = moved_to
+    assert issue.percentage_tasks_done == 25
+
+
+GRAPHQL_NODE: Dict[str, Any] = {
+    "id": "gid://gitlab/Issue/42",
+    "iid": "7",
+    "projectId": 3,
+    "title": "Title",
+    "description": "Description",
+    "state": "closed",
+    "webUrl": "https://gitlab.com/group/project/-/issues/7",
+    "reference": "group/project#7",
+    "createdAt": "2020-10-01T10:11:12Z",
+    "closedAt": "2020-10-05T08:00:00Z",
+    "dueDate": "2020-11-01T00:00:00Z",
+    "movedTo": {"id": "gid://gitlab/Issue/43"},
+    "timeEstimate": 7200,
+    "totalTimeSpent": 3600,
+    "taskCompletionStatus": {"count": 4, "completedCount": 1},
+    "assignees": {"nodes": [{"name": "Carli"}]},
+    "labels": {"nodes": [{"title": "bug"}, {"title": "to do"}]},
+}
+
+
+def test_graphql_to_rest_attributes():
+    attributes = _graphql_to_rest_attributes(GRAPHQL_NODE)
+    assert attributes["id"] == 42
+    assert attributes["iid"] == 7
+    assert attributes["project_id"] == 3
+    assert attributes["web_url"] == GRAPHQL_NODE["webUrl"]
+    assert attributes["references"] == {"full": "group/project#7"}
+    assert attributes["due_date"] == "2020-11-01"
+    assert attributes["moved_to_id"] == 43
+    assert attributes["time_stats"] == {
+        "time_estimate": 7200,
+        "total_time_spent": 3600,
+    }
+    assert attributes["has_tasks"]
+    assert attributes["task_completion_status"] == {"count": 4, "completed_count": 1}
+    assert attributes["assignees"] == [{"name": "Carli"}]
+    assert attributes["labels"] == ["bug", "to do"]
+
+
+def test_graphql_to_rest_attributes_empty_values():
+    node = dict(
+        GRAPHQL_NODE,
+        dueDate=None,
+        closedAt=None,
+        movedTo=None,
+        taskCompletionStatus=None,
+    )
+    attributes = _graphql_to_rest_attributes(node)
+    assert attributes["due_date"] is None
+    assert attributes["closed_at"] is None
+    assert attributes["moved_to_id"] is None
+    assert not attributes["has_tasks"]
+    assert attributes["task_completion_status"] == {"count": 0, "completed_count": 0}
+
+
+def test_issue_from_graphql():
+    issue = Issue.from_graphql(dict(GRAPHQL_NODE, movedTo=None))
+    assert issue.id == 42
+    assert issue.full_ref == "group/project#7"
+    assert issue.is_closed
+    assert issue.due_date == datetime(2020, 11, 1)
+    assert issue.time_estimated == 120
+    assert issue.assignees == ("Carli",)
+    assert issue.labels == ("bug", "to do")
@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 import pytest
 
-from datetime import datetime
+import pywintypes
+from datetime import datetime, timedelta, timezone
 from functools import partial
 from inspect import getattr_static, signature
 from pathlib import Path
@@ -12,7 +13,12 @@ from syncgitlab2msproject.exceptions import (
     LoadingError,
     MSProjectSyncError,
 )
-from syncgitlab2msproject.ms_project import MSProject, PjTaskFixedType
+from syncgitlab2msproject.ms_project import (
+    MSProject,
+    PjTaskFixedType,
+    na_win2py_datetime,
+    win2python_datetime,
+)
 
 __author__ = "Carli"
 __copyright__ = "Carli"
@@ -192,3 +198,28 @@ def test_percentage():
             # Test setting attributes based on typed annotation
             task = tasks[0]
             task.percent_complete = 101
+
+
+@pytest.mark.parametrize(
+    "tzinfo", [None, timezone.utc, timezone(timedelta(hours=1, minutes=30))]
+)
+def test_win2python_datetime(tzinfo):
+    win_time = pywintypes.datetime(2021, 1, 31, 8, 15, 30, 500, tzinfo=tzinfo)
+    converted = win2python_datetime(win_time)
+    assert type(converted) is datetime
+    assert converted == datetime(2021, 1, 31, 8, 15, 30, 500, tzinfo=tzinfo)
+    assert converted.utcoffset() == win_time.utcoffset()
+
+
+@pytest.mark.parametrize("value", [None, "NA", "na"])
+def test_na_win2py_datetime_empty(value):
+    assert na_win2py_datetime(value) is None
+    if value is None:
+        assert win2python_datetime(value) is None
+
+
+def test_na_win2py_datetime():
+    win_time = pywintypes.datetime(2021, 1, 31, 8, 15, tzinfo=timezone.utc)
+    assert na_win2py_datetime(win_time) == datetime(
+        2021, 1, 31, 8, 15, tzinfo=timezone.utc
+    )
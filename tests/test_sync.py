@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from typing import Any, Callable, List
+
+from syncgitlab2msproject.custom_types import IssueRef
+from syncgitlab2msproject.exceptions import (
+    IssueReferenceDuplicated,
+    MovedIssueNotDefined,
+)
+from syncgitlab2msproject.gitlab_issues import Issue
+from syncgitlab2msproject.helper_classes import SetTaskTypeConservative
+from syncgitlab2msproject.ms_project import PjTaskFixedType, Task
+from syncgitlab2msproject.sync import (
+    GL_PREFIX,
+    IssueFinder,
+    get_issue_ref_text,
+    update_task_with_issue_data,
+)
+
+__author__ = "Carli"
+__copyright__ = "Carli"
+__license__ = "MIT"
+
+# Fields that are only written if their value changed
+CHECKED_FIELDS = {
+    "Text30",
+    "Text29",
+    "Text28",
+    "Name",
+    "Work",
+    "ActualWork",
+    "PercentComplete",
+    "Hyperlink",
+    "HyperlinkAddress",
+    "ResourceNames",
+}
+
+
+class FakeComTask:
+    """
+    Stands in for the COM object of a MS Project task and records all writes
+    """
+
+    def __init__(self, name: str):
+        values = dict(
+            Name=name,
+            ID=1,
+            Text30="",
+            Text29="",
+            Text28="",
+            Hyperlink="",
+            HyperlinkAddress="",
+            ResourceNames="",
+            Duration=8 * 60,
+            Work=0,
+            ActualWork=0,
+            PercentComplete=0,
+            Estimated=True,
+            OutlineChildren=[],
+            Type=PjTaskFixedType.pjFixedUnits.value,
+            EffortDriven=False,
+            Deadline="NA",
+            ActualStart="NA",
+            ActualFinish="NA",
+        )
+        object.__setattr__(self, "writes", [])
+        for key, value in values.items():
+            object.__setattr__(self, key, value)
+
+    def __setattr__(self, key: str, value: Any):
+        self.writes.append(key)
+        object.__setattr__(self, key, value)
+
+
+def make_task(name: str = "Task") -> Task:
+    return Task._from_com(None, 1, FakeComTask(name))  # type: ignore
+
+
+def get_writes(task: Task) -> List[str]:
+    return task._get_task().writes
+
+
+def sync(task: Task, issue: Issue) -> List[IssueRef]:
+    return update_task_with_issue_data(task, issue, SetTaskTypeConservative)
+
+
+def test_finder(make_issue: Callable[..., Issue]):
+    issues = [make_issue(1), make_issue(2, moved_to_id=3), make_issue(3)]
+    finder = IssueFinder(issues)
+    assert finder.by_ref_id(IssueRef(2)) is issues[1]
+    assert finder.by_web_url(issues[2].web_url) is issues[2]
+    assert finder.non_moved == [(IssueRef(1), issues[0]), (IssueRef(3), issues[2])]
+    with pytest.raises(KeyError):
+        finder.by_ref_id(IssueRef(4))
+
+
+@pytest.mark.parametrize(
+    "duplicated",
+    [
+        {"id": 1},
+        {"web_url": "https://gitlab.com/group/project/-/issues/1"},
+    ],
+)
+def test_finder_duplicates(make_issue: Callable[..., Issue], duplicated):
+    issues = [make_issue(1), make_issue(2), make_issue(3, **duplicated)]
+    with pytest.raises(IssueReferenceDuplicated):
+        IssueFinder(issues)
+
+
+def test_finder_link_moved_issues(make_issue: Callable[..., Issue]):
+    issues = [make_issue(1, moved_to_id=2), make_issue(2), make_issue(3, moved_to_id=9)]
+    IssueFinder(issues).link_moved_issues()
+    assert issues[0].moved_reference is issues[1]
+    assert issues[1].moved_reference is None
+    # The issue moved to was not loaded
+    with pytest.raises(MovedIssueNotDefined):
+        issues[2].moved_reference
+
+
+def test_sync_new_task(make_issue: Callable[..., Issue]):
+    issue = make_issue(1)
+    task = make_task()
+    assert sync(task, issue) == [IssueRef(1)]
+    com_task = task._get_task()
+    assert com_task.Text30 == get_issue_ref_text(issue)
+    assert com_task.Name == issue.title
+    assert com_task.Work == 120
+    assert com_task.ActualWork == 60
+    assert com_task.Text28 == '"bug"; "to do"'
+    assert com_task.HyperlinkAddress == issue.web_url
+    assert com_task.Text29 == issue.web_url
+    assert com_task.ResourceNames == "Carli"
+    assert com_task.Type == PjTaskFixedType.pjFixedUnits.value
+
+
+def test_sync_skips_unchanged_values(make_issue: Callable[..., Issue]):
+    task = make_task()
+    sync(task, make_issue(1))
+    get_writes(task).clear()
+    sync(task, make_issue(1))
+    assert not CHECKED_FIELDS.intersection(get_writes(task))
+
+
+def test_sync_writes_changed_values(make_issue: Callable[..., Issue]):
+    task = make_task()
+    sync(task, make_issue(1))
+    get_writes(task).clear()
+    sync(task, make_issue(1, title="New Title", labels=["bug"]))
+    assert CHECKED_FIELDS.intersection(get_writes(task)) == {"Name", "Text28"}
+    assert task.name == "New Title"
+
+
+def test_sync_moved_issue(make_issue: Callable[..., Issue]):
+    issue = make_issue(1, state="closed", moved_to_id=2)
+    moved_to = make_issue(2, title="Moved")
+    issue.moved_reference = moved_to
+    task = make_task()
+    assert sync(task, issue) == [IssueRef(1), IssueRef(2)]
+    assert task.name == "Moved"
+
+
+def test_sync_moved_outside_of_context(make_issue: Callable[..., Issue]):
+    task = make_task()
+    assert sync(task, make_issue(1, moved_to_id=9)) == [IssueRef(1)]
+    assert get_writes(task) == []
+
+
+def test_issue_ref_text_moved_outside_of_context(make_issue: Callable[..., Issue]):
+    # The moved issue was not loaded, the reference must not need it
+    issue = make_issue(1, state="closed", moved_to_id=9)
+    assert get_issue_ref_text(issue) == f"{GL_PREFIX}1;5;3;1"